@@ -8,25 +8,51 @@ import streamlit as st
 from domain.decoder import WordByWordDecoder
 from domain.translator import Translator
 from services.translation_service import (
-    TranslationService,
     GoogleDeepTranslatorService,
     ArgosTranslateService,
 )
-from services.ocr_service import TesseractOCRService, EasyOCRService
+# The OCR stack (PIL, numpy, EasyOCR) is imported lazily below, only once an
+# image is actually uploaded, to keep the app's cold start fast
 
-# For image processing
-from PIL import Image
-import io
+# textwrap: Standard library module for wrapping text to a given width
+import textwrap
+# Iterator: Type hint for generators (functions that yield values one by one)
+from typing import Iterator
 
-# Dictionary of available translation services
+# Dictionary of available translation services (display name → service class)
 # Makes it easy to add new services - just add them here!
 AVAILABLE_SERVICES = {
-    "Google Translate": GoogleDeepTranslatorService(),
-    "Argos Translate": ArgosTranslateService(),
+    "Google Translate": GoogleDeepTranslatorService,
+    "Argos Translate": ArgosTranslateService,
 }
+# Option list for the service radio buttons, built once at import time
+_SERVICE_NAMES = tuple(AVAILABLE_SERVICES)
+
+
+# @st.cache_resource creates the objects once per process and shares them
+# across all reruns and sessions instead of rebuilding them on every interaction
+@st.cache_resource
+def get_services(service_name: str):
+    """Create translation service, decoder and translator for one service (once per process).
+    
+    Returns:
+        Tuple of (translation service, decoder, translator)
+    """
+    service = AVAILABLE_SERVICES[service_name]()
+    return service, WordByWordDecoder(service), Translator(service)
+
+
+@st.cache_resource
+def get_ocr_service():
+    """Create the OCR service once, so its loaded model is reused across reruns.
+    
+    Uses EasyOCR as default (works on Streamlit Cloud without additional installation)
+    """
+    # Imported here so numpy/PIL are only loaded when OCR is actually used
+    from services.ocr_service import EasyOCRService
+    
+    return EasyOCRService()
 
-# OCR Service - Use EasyOCR as default (works on Streamlit Cloud without additional installation)
-_ocr_service = EasyOCRService()
 
 # These will be initialized when user selects a service
 _decoder = None
@@ -46,11 +72,13 @@ LANGUAGES = {
     "English (en)": "en",
     "Portuguese (pt)": "pt",
 }
+# Option list for the language dropdowns, built once instead of on every rerun
+_LANG_LABELS = tuple(LANGUAGES)
 
-# Apply custom CSS styling to make text areas use monospace font
+# Custom CSS styling to make text areas use monospace font
 # This makes the aligned output look better
 # Triple quotes for multi-line string
-st.markdown(
+_CUSTOM_CSS = (
     """
     <style>
       textarea {
@@ -59,23 +87,27 @@ st.markdown(
         line-height: 1.35 !important;
       }
       
-      /* Green button for Decode */
-      button[kind="primary"] {
+      /* Green button for Decode (form submit buttons use the *FormSubmit kinds) */
+      button[kind="primary"],
+      button[kind="primaryFormSubmit"] {
         background-color: #28a745 !important;
         border-color: #28a745 !important;
       }
-      button[kind="primary"]:hover {
+      button[kind="primary"]:hover,
+      button[kind="primaryFormSubmit"]:hover {
         background-color: #218838 !important;
         border-color: #1e7e34 !important;
       }
       
       /* Blue button for Translate */
-      button[kind="secondary"] {
+      button[kind="secondary"],
+      button[kind="secondaryFormSubmit"] {
         background-color: #007bff !important;
         border-color: #007bff !important;
         color: white !important;
       }
-      button[kind="secondary"]:hover {
+      button[kind="secondary"]:hover,
+      button[kind="secondaryFormSubmit"]:hover {
         background-color: #0056b3 !important;
         border-color: #004085 !important;
       }
@@ -103,10 +135,15 @@ st.markdown(
         border-color: #999999 !important;
       }
     </style>
-    """,
-    unsafe_allow_html=True,  # Allow HTML/CSS in markdown
+    """
 )
 
+# Inject the CSS on every run: Streamlit removes elements that a rerun does not
+# emit again, so a "once per session" guard would drop the styling after the
+# first interaction. Re-sending the identical element is cheap, because the
+# frontend sees an unchanged element and does not touch the DOM.
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)  # Allow HTML/CSS in markdown
+
 # Display the main title and subtitle
 st.title("Language Decoder")
 st.caption("Paste text → select languages → configure → decode")
@@ -131,33 +168,20 @@ def apply_line_breaks(text: str, max_chars: int) -> str:
     if max_chars <= 0:
         return text
 
-    lines = []              # List to collect all lines
-    current_line = ""       # Current line being built
-
-    # Go through each word
-    for word in text.split(" "):
-        # Check if word fits on current line (+ 1 for the space)
-        if len(current_line) + len(word) + 1 <= max_chars:
-            # Word fits! Add it to current line
-            # Add space before word, but not if line is empty
-            current_line += (" " if current_line else "") + word
-        else:
-            # Word doesn't fit - save current line and start new one
-            lines.append(current_line)
-            current_line = word
-
-    # Don't forget the last line
-    if current_line:
-        lines.append(current_line)
-
-    # Join all lines with newline characters
-    return "\n".join(lines)
+    # textwrap (standard library) does the greedy word packing for us
+    # break_long_words=False: never split a word, even if it is longer than max_chars
+    # break_on_hyphens=False: only break at spaces (also keeps textwrap's regex simpler)
+    # Each existing line is wrapped on its own, so original line breaks are kept
+    return "\n".join(
+        textwrap.fill(line, width=max_chars, break_long_words=False, break_on_hyphens=False)
+        for line in text.split("\n")
+    )
 
 # -------------------------------------------------
 # 3) Decoder function - connects UI to our decoder
 # -------------------------------------------------
 
-def decode_text(text: str, source_lang: str, target_lang: str) -> str:
+def decode_text(text: str, source_lang: str, target_lang: str) -> Iterator[str]:
     """Wrapper function to call our decoder with the right parameters.
     
     Args:
@@ -166,11 +190,17 @@ def decode_text(text: str, source_lang: str, target_lang: str) -> str:
         target_lang: Target language code
         
     Returns:
-        Decoded and formatted text
+        Generator yielding the decoded and formatted text line by line
     """
-    # Call the decoder's decode method
+    # Nothing to translate: return the input unchanged without any API calls
+    if source_lang == target_lang:
+        return iter([text])
+    
+    # Stream the result so the UI can show lines as soon as they are ready
+    # Not wrapped in st.cache_data (a generator can't be cached); repeated
+    # words are answered by the translation service's own word cache
     # max_line_length comes from the UI config below (defined later in the code)
-    return _decoder.decode(
+    return _decoder.decode_stream(
         text=text,
         source_lang=source_lang,
         target_lang=target_lang,
@@ -189,7 +219,13 @@ def translate_text(text: str, source_lang: str, target_lang: str) -> str:
     Returns:
         Translated text
     """
+    # Nothing to translate: return the input unchanged without any API calls
+    if source_lang == target_lang:
+        return text
+    
     # Call the translator's translate method
+    # Not wrapped in st.cache_data: repeated sentences are answered by the
+    # translation service's own text cache, which never stores error placeholders
     return _translator.translate(
         text=text,
         source_lang=source_lang,
@@ -206,18 +242,14 @@ with st.expander("Decoder configuration", expanded=True):
     # Radio button for translation service selection
     selected_service_name = st.radio(
         "Translation Service",
-        options=list(AVAILABLE_SERVICES.keys()),
+        options=_SERVICE_NAMES,
         index=0,  # Default: first service (Google Translate)
         help="Choose which translation service to use for decoding and translation.",
         horizontal=True,  # Display options horizontally
     )
     
-    # Get the selected service instance
-    _translation_service = AVAILABLE_SERVICES[selected_service_name]
-    
-    # Initialize decoder and translator with selected service
-    _decoder = WordByWordDecoder(_translation_service)
-    _translator = Translator(_translation_service)
+    # Get the (cached) service instance, decoder and translator for the selected service
+    _translation_service, _decoder, _translator = get_services(selected_service_name)
     
     # st.number_input creates a number input field
     # The return value is stored in max_line_length
@@ -242,7 +274,7 @@ with col_left:
     # st.selectbox creates a dropdown menu
     source_label = st.selectbox(
         "Source Language",              # Label above dropdown
-        list(LANGUAGES.keys()),         # Options to choose from
+        _LANG_LABELS,                   # Options to choose from
         index=2,                        # Default selection: index 2 = Portuguese
     )
 
@@ -250,7 +282,7 @@ with col_left:
 with col_right:
     target_label = st.selectbox(
         "Target Language (Mother Tongue)",
-        list(LANGUAGES.keys()),
+        _LANG_LABELS,
         index=0,  # Default selection: index 0 = German
     )
 
@@ -288,6 +320,9 @@ with ocr_tab2:
 image_source = uploaded_file or camera_photo
 
 if image_source:
+    # Imported only when there is an image to process (see imports at the top)
+    from PIL import Image
+    
     # Display the image
     image = Image.open(image_source)
     st.image(image, caption="Image to process", use_container_width=True)
@@ -296,10 +331,11 @@ if image_source:
     if st.button("🔍 Extract Text (OCR)", type="secondary", use_container_width=True):
         with st.spinner('Extracting text from image...'):
             # Get language code for OCR
-            ocr_lang = EasyOCRService.get_language_code(source_label)
+            ocr_service = get_ocr_service()
+            ocr_lang = ocr_service.get_language_code(source_label)
             
             # Perform OCR
-            extracted_text = _ocr_service.extract_text(image, lang=ocr_lang)
+            extracted_text = ocr_service.extract_text(image, lang=ocr_lang)
             
             # Insert at current position (append to existing text)
             if st.session_state.input_text:
@@ -314,39 +350,46 @@ if image_source:
 
 st.markdown("---")  # Separator line
 
-# st.text_area creates a multi-line text input field
-# Now using session state to allow OCR text insertion
-# key="input_text" directly binds to st.session_state.input_text
-input_text = st.text_area(
-    "Input text",
-    height=220,
-    placeholder="Paste your text here or use OCR above…",
-    key="input_text",  # This automatically syncs with st.session_state.input_text
-)
-
 # Show warning if user selected same language for source and target
-if source_language == target_language:
-    st.warning("Source and target language are identical.")
-
-# Create two buttons side by side
-# st.columns creates columns for side-by-side layout
-btn_col1, btn_col2 = st.columns(2)
-
-# st.button creates a clickable button
-# Returns True when clicked, False otherwise
-with btn_col1:
-    decode_clicked = st.button(
-        "Decode",                          # Button text
-        type="primary",                    # Makes button blue/prominent
-        use_container_width=True,          # Makes button full width
+# In that case the buttons are disabled, there is nothing to translate
+languages_identical = source_language == target_language
+if languages_identical:
+    st.warning("Source and target language are identical. Decode and Translate are disabled.")
+
+# st.form groups the input and the buttons: typing in the text area does not
+# rerun the whole script, only pressing Decode or Translate does
+with st.form("decoder_form", border=False):
+    # st.text_area creates a multi-line text input field
+    # Now using session state to allow OCR text insertion
+    # key="input_text" directly binds to st.session_state.input_text
+    input_text = st.text_area(
+        "Input text",
+        height=220,
+        placeholder="Paste your text here or use OCR above…",
+        key="input_text",  # This automatically syncs with st.session_state.input_text
     )
 
-with btn_col2:
-    translate_clicked = st.button(
-        "Translate",                       # Button text
-        type="secondary",                  # Secondary button style
-        use_container_width=True,          # Makes button full width
-    )
+    # Create two buttons side by side
+    # st.columns creates columns for side-by-side layout
+    btn_col1, btn_col2 = st.columns(2)
+
+    # st.form_submit_button submits the form (buttons inside a form must be submit buttons)
+    # Returns True when clicked, False otherwise
+    with btn_col1:
+        decode_clicked = st.form_submit_button(
+            "Decode",                          # Button text
+            type="primary",                    # Makes button blue/prominent
+            use_container_width=True,          # Makes button full width
+            disabled=languages_identical,      # No wasted requests for same-language input
+        )
+
+    with btn_col2:
+        translate_clicked = st.form_submit_button(
+            "Translate",                       # Button text
+            type="secondary",                  # Secondary button style
+            use_container_width=True,          # Makes button full width
+            disabled=languages_identical,      # No wasted requests for same-language input
+        )
 
 # -------------------------------------------------
 # 6) Output section
@@ -362,16 +405,28 @@ if "translated_text" not in st.session_state:
 # Check if the Decode button was clicked
 if decode_clicked:
     try:
+        # st.empty() reserves a spot on the page that we can overwrite
+        # It shows the lines decoded so far while the rest is still running
+        progress_placeholder = st.empty()
+        decoded_chunks = []
+        
         # Show a spinner while processing
         with st.spinner('Decoding...'):
             # Perform the decoding
             # .strip() removes leading/trailing whitespace from input
             # The decoder already handles line breaks internally
-            st.session_state.decoded_text = decode_text(
+            for chunk in decode_text(
                 input_text.strip(),
                 source_language,
                 target_language,
-            )
+            ):
+                decoded_chunks.append(chunk)
+                # st.code uses a monospace font, so the alignment is kept
+                progress_placeholder.code("\n".join(decoded_chunks), language=None)
+        
+        # The final result is shown in the text area below
+        progress_placeholder.empty()
+        st.session_state.decoded_text = "\n".join(decoded_chunks)
         st.success('Decoding completed!')
     except Exception as e:
         st.error(f'Error during decoding: {str(e)}')
@@ -412,13 +467,13 @@ st.text_area(
 )
 
 # Create combined output for download
-combined_output = ""
+# Collect the pieces in a list and join them once (no repeated string copying)
+combined_parts = []
 if st.session_state.decoded_text:
-    combined_output += "=== DECODED (Word-by-Word) ===\n\n"
-    combined_output += st.session_state.decoded_text + "\n\n"
+    combined_parts += ["=== DECODED (Word-by-Word) ===\n\n", st.session_state.decoded_text, "\n\n"]
 if st.session_state.translated_text:
-    combined_output += "=== TRANSLATED (Natural) ===\n\n"
-    combined_output += st.session_state.translated_text + "\n"
+    combined_parts += ["=== TRANSLATED (Natural) ===\n\n", st.session_state.translated_text, "\n"]
+combined_output = "".join(combined_parts)
 
 # Download button to save both outputs as a text file
 st.download_button(
@@ -1,19 +1,42 @@
 # Enable modern type hints (allows referencing class names before definition)
 from __future__ import annotations
 
+# io: StringIO is an in-memory text buffer we can write() to like a file
+import io
+# re: Regular expressions for pattern matching in text
+import re
 # dataclass: Automatically generates __init__, __repr__, etc. based on class attributes
-from dataclasses import dataclass
+# field: Customizes a single dataclass attribute (here: computed, not passed in)
+from dataclasses import dataclass, field
 # List: Type hint for lists, e.g., List[str] means "a list of strings"
-from typing import List
+# Iterator: Type hint for generators, e.g., Iterator[str] yields strings one by one
+# Tuple: Type hint for fixed-size tuples, e.g., Tuple[str, str]
+from typing import Iterator, List, Tuple
 
 # Import from services → translation_service module
-# TranslationService is the interface (Protocol) for translation providers
+# TranslationService is the interface (abstract base class) for translation providers
 from services.translation_service import TranslationService
 
 
+# Splits a token into (leading punctuation, word, trailing punctuation)
+# Example: "«world,»" → ("«", "world", ",»")
+# Compiled once at import time instead of on every call
+_PUNCT_SPLIT = re.compile(r"^(\W*)(.*?)(\W*)$")
+
+# decode_stream() translates the words of several lines in one call,
+# until a batch holds at least this many words
+STREAM_BATCH_WORDS = 500
+
+# Default cap on the number of words decoded per call (protects against huge pastes)
+MAX_TOKENS = 1000
+# Shown as the last word when the input was cut off at max_tokens
+TRUNCATION_MARKER = "[TRUNCATED]"
+
+
 # @dataclass creates a simple data container class automatically
 # frozen=True makes this class immutable (can't change values after creation)
-@dataclass(frozen=True)
+# slots=True stores the attributes without a per-instance __dict__ (less memory, faster access)
+@dataclass(frozen=True, slots=True)
 class TokenPair:
     """Represents a pair of tokens: source word and its translation.
     
@@ -21,17 +44,18 @@ class TokenPair:
     """
     source_token: str  # The original word (e.g., "hello")
     target_token: str  # The translated word (e.g., "hallo")
+    # The column width needed to display both words aligned:
+    # the length of the longer word, so both fit in the same column
+    # Example: "hello" (5) and "hallo" (5) → 5
+    #          "hi" (2) and "hallo" (5) → 5
+    # init=False: not a constructor argument, it is computed in __post_init__
+    column_width: int = field(init=False)
 
-    # @property makes this method accessible like an attribute: pair.column_width instead of pair.column_width()
-    @property
-    def column_width(self) -> int:
-        """Calculate the column width needed to display both words aligned.
-        
-        Returns the length of the longer word so both can fit in the same column.
-        Example: "hello" (5) and "hallo" (5) → returns 5
-                 "hi" (2) and "hallo" (5) → returns 5
-        """
-        return max(len(self.source_token), len(self.target_token))
+    def __post_init__(self):
+        """Compute column_width once, right after the dataclass __init__."""
+        # The class is frozen, so normal assignment would raise an error;
+        # object.__setattr__ bypasses that check (only done here, during creation)
+        object.__setattr__(self, "column_width", max(len(self.source_token), len(self.target_token)))
 
 
 class WordByWordDecoder:
@@ -48,11 +72,19 @@ class WordByWordDecoder:
 
     """
 
+    # __slots__ lists the only attributes an instance may have,
+    # so Python stores them without a per-instance __dict__
+    __slots__ = ("translation_service",)
+
     # __init__ is the constructor - called when creating a new instance
     # self refers to the instance being created
     def __init__(self, translation_service: TranslationService):
         """Initialize the decoder with a translation service.
         
+        Repeated words are answered by the translation service's own caches
+        (shared by all decoders, with expiry and invalidation), so the
+        decoder keeps no cache of its own.
+        
         Args:
             translation_service: Any object that implements the translate_word method
         """
@@ -66,6 +98,7 @@ class WordByWordDecoder:
         source_lang: str,
         target_lang: str,
         max_line_length: int,
+        max_tokens: int = MAX_TOKENS,
     ) -> str:
         """Main method to decode text word-by-word.
         
@@ -74,38 +107,116 @@ class WordByWordDecoder:
             source_lang: Language code of input text (e.g., "en")
             target_lang: Language code for translation (e.g., "de")
             max_line_length: Maximum characters per line before breaking
+            max_tokens: Maximum number of words to decode; the rest is cut off
+                and marked with [TRUNCATED] (0 or less: no limit)
             
         Returns:
             Formatted string with aligned translations
         """
+        # Collect the streamed chunks into one string
+        return "\n".join(
+            self.decode_stream(
+                text, source_lang, target_lang, max_line_length=max_line_length, max_tokens=max_tokens
+            )
+        )
+
+    def decode_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        max_line_length: int,
+        max_tokens: int = MAX_TOKENS,
+    ) -> Iterator[str]:
+        """Decode text line by line, yielding each finished line right away.
+        
+        Same arguments as decode(). This is a generator: the caller can show
+        the first lines while the rest is still being translated.
+        
+        Yields:
+            The formatted, aligned output of one input line ("" for empty lines)
+        """
         # Clean up the input: if text is None, use ""
         text = (text or "").strip()
         
-        # Early return: if text is empty, just return empty string
+        # Early return: if text is empty, there is nothing to yield
         if not text:
-            return ""
+            return
 
-        # Process each line separately to preserve line breaks
-        lines = text.split('\n')
-        decoded_lines = []
-        
+        # Common case: a single line - no need to split into lines first
+        lines = text.split('\n') if '\n' in text else [text]
+
+        # Collect lines into batches, so one translation call covers many lines
+        # instead of one call per line; each batch is yielded as soon as it is done
+        batch: List[List[str]] = []  # Tokens of each line in the current batch
+        batch_words = 0
+        words_left = max_tokens  # Only counts down if there is a limit (max_tokens > 0)
+        truncated = False
         for line in lines:
-            line = line.strip()
-            # Skip empty lines but preserve them in output
-            if not line:
-                decoded_lines.append("")
-                continue
-                
-            # Step 1: Split line into individual words
+            # Step 1: Split line into individual words (empty lines give [])
             tokens = self._tokenize(line)
-            
-            # Step 2: Translate each word and create TokenPair objects
-            pairs = self._translate_tokens(tokens, source_lang, target_lang)
-            
-            # Step 3: Format the pairs into aligned two-line output with line breaks
-            decoded_lines.append(self._format_aligned(pairs, max_line_length=max_line_length))
+
+            # Stop before translating anything beyond the word limit
+            if max_tokens > 0:
+                if len(tokens) > words_left:
+                    tokens = tokens[:words_left]
+                    truncated = True
+                words_left -= len(tokens)
+                # A line cut down to nothing is dropped, not shown as an empty line
+                if truncated and not tokens:
+                    break
+
+            batch.append(tokens)
+            batch_words += len(tokens)
+            if batch_words >= STREAM_BATCH_WORDS:
+                yield from self._decode_batch(batch, source_lang, target_lang, max_line_length)
+                batch = []
+                batch_words = 0
+            if truncated:
+                break
+
+        # Don't forget the last, partly filled batch
+        if batch:
+            yield from self._decode_batch(batch, source_lang, target_lang, max_line_length)
+
+        # Tell the reader that the rest of the input was skipped
+        if truncated:
+            yield self._format_aligned(
+                [TokenPair(source_token=TRUNCATION_MARKER, target_token="")],
+                max_line_length=max_line_length,
+            )
+
+    def _decode_batch(
+        self,
+        lines: List[List[str]],
+        source_lang: str,
+        target_lang: str,
+        max_line_length: int,
+    ) -> Iterator[str]:
+        """Translate the tokens of several lines together, then yield each line formatted.
         
-        return "\n".join(decoded_lines)
+        Args:
+            lines: One token list per input line ([] for empty lines)
+            
+        Yields:
+            The formatted output of each line ("" for empty lines)
+        """
+        # Step 2: Translate all words of the batch at once and create TokenPair objects
+        # (flattened into one list; the pairs come back in the same order)
+        pairs = self._translate_tokens(
+            [token for tokens in lines for token in tokens], source_lang, target_lang
+        )
+
+        # Step 3: Cut the pairs back into lines and format each one
+        start = 0
+        for tokens in lines:
+            # Skip empty lines but preserve them in output
+            if not tokens:
+                yield ""
+                continue
+            end = start + len(tokens)
+            yield self._format_aligned(pairs[start:end], max_line_length=max_line_length)
+            start = end
 
     # Methods starting with _ are "private" - meant for internal use only
     def _tokenize(self, text: str) -> List[str]:
@@ -140,26 +251,39 @@ class WordByWordDecoder:
         Returns:
             List of TokenPair objects (original word + translation)
         """
-        # Create an empty list to store the pairs
-        pairs: List[TokenPair] = []
-        
-        # Loop through each word
-        for token in tokens:
-            # try-except block handles errors gracefully
-            try:
-                # Call the translation service to translate this word
-                translated = self.translation_service.translate_word(
-                    token, source_lang=source_lang, target_lang=target_lang
-                )
-            except Exception as exc:
-                # If translation fails, use an error message instead
-                # f"..." is an f-string: formats the exception into the string
-                translated = f"[ERR:{exc}]"
-            
-            # Create a TokenPair and add it to our list
-            pairs.append(TokenPair(source_token=token, target_token=translated))
-        
-        return pairs
+        # Split off punctuation, so "world," and "world." are both translated as "world"
+        # dict.fromkeys removes duplicates but keeps the original order
+        split_tokens = {
+            token: _PUNCT_SPLIT.match(token).groups() for token in dict.fromkeys(tokens)
+        }
+
+        # Translate every distinct word only once (pure punctuation is not translated)
+        unique_words = list(dict.fromkeys(word for _, word, _ in split_tokens.values() if word))
+
+        try:
+            # One batch request for all words instead of one request per word
+            translations = self.translation_service.translate_words(
+                unique_words, source_lang=source_lang, target_lang=target_lang
+            )
+            lookup = dict(zip(unique_words, translations))
+        except Exception:
+            # Batch failed: translate word by word so only the broken words show an error
+            translations = self.translation_service.translate_words_safely(
+                unique_words, source_lang=source_lang, target_lang=target_lang
+            )
+            lookup = dict(zip(unique_words, translations))
+
+        # Put the punctuation back around each translation
+        translated_tokens = {
+            token: f"{prefix}{lookup[word]}{suffix}" if word else token
+            for token, (prefix, word, suffix) in split_tokens.items()
+        }
+
+        # Create a TokenPair for every original word (duplicates included)
+        return [
+            TokenPair(source_token=token, target_token=translated_tokens[token])
+            for token in tokens
+        ]
 
     def _format_aligned(self, pairs: List[TokenPair], max_line_length: int) -> str:
         """
@@ -181,52 +305,41 @@ class WordByWordDecoder:
         if max_line_length <= 0:
             return self._format_single_block(pairs)
 
-        # List to collect all output lines
-        output_lines: List[str] = []
+        # Buffer to collect all output lines (written once, no list to join afterwards)
+        buffer = io.StringIO()
         
         # Variables to build current line pair
-        source_line = ""     # Current source language line being built
-        target_line = ""     # Current target language line being built
-        running_width = 0    # Track how many characters we've used so far
+        current: List[TokenPair] = []  # Pairs that go on the current output line
+        running_width = 0              # Track how many characters we've used so far
 
         # Process each word pair
         for pair in pairs:
             # Get the width needed for this column (length of longer word)
             width = pair.column_width
-            
-            # .ljust(width) pads the string with spaces to reach 'width' characters
-            # Example: "hi".ljust(5) → "hi   "
-            source_chunk = pair.source_token.ljust(width) + " "
-            target_chunk = pair.target_token.ljust(width) + " "
 
             # Check: would adding this word (with space) exceed our line length limit?
             # We check if adding width+1 (word + space) would exceed the limit
             if running_width > 0 and running_width + width + 1 > max_line_length:
                 # Yes! Save current lines and start new ones
-                # .rstrip() removes trailing spaces
-                output_lines.append(source_line.rstrip())
-                output_lines.append(target_line.rstrip())
-                output_lines.append("")  # Add blank line between blocks
+                source_line, target_line = self._join_columns(current)
+                buffer.write(f"{source_line}\n{target_line}\n\n")  # Blank line between blocks
                 
                 # Reset for next line
-                source_line = ""
-                target_line = ""
+                current.clear()
                 running_width = 0
 
-            # Add the word chunks to current lines
-            source_line += source_chunk
-            target_line += target_chunk
+            current.append(pair)
             running_width += width + 1  # +1 for the space after each word
 
         # Don't forget the last line if there's anything left
-        if source_line or target_line:
-            output_lines.append(source_line.rstrip())
-            output_lines.append(target_line.rstrip())
-            output_lines.append("")  # Blank line at end
+        if current:
+            source_line, target_line = self._join_columns(current)
+            buffer.write(f"{source_line}\n{target_line}\n\n")
 
-        # Join all lines with newline characters
-        # .rstrip() removes trailing newlines, then we add one back
-        return "\n".join(output_lines).rstrip() + "\n"
+        # Every block ends with a blank line; drop it (and the empty target line
+        # of a block without translations) so the output ends with a single newline
+        # (and is just "\n" if there were no pairs)
+        return buffer.getvalue().rstrip() + "\n"
 
     def _format_single_block(self, pairs: List[TokenPair]) -> str:
         """Format all pairs into a single two-line block (no line breaks).
@@ -236,18 +349,34 @@ class WordByWordDecoder:
         Returns:
             Two lines: source words on top, translations below, aligned by column
         """
-        source_line = ""  # Build the top line (original language)
-        target_line = ""  # Build the bottom line (translation)
-        
         # Process all pairs at once (no line breaking)
-        for pair in pairs:
-            # Get column width for alignment
-            width = pair.column_width
-            
-            # Add word padded to column width + extra space
-            source_line += pair.source_token.ljust(width) + " "
-            target_line += pair.target_token.ljust(width) + " "
-        
-        # Return both lines with trailing spaces removed
+        source_line, target_line = self._join_columns(pairs)
         # \n is newline character
-        return (source_line.rstrip() + "\n" + target_line.rstrip() + "\n")
+        return f"{source_line}\n{target_line}\n"
+
+    def _join_columns(self, pairs: List[TokenPair]) -> Tuple[str, str]:
+        """Build the aligned source line and target line for one block.
+        
+        Every word except the last is padded to its column width plus one
+        separating space. The last word is not padded, but empty translations
+        at the end of the target line still leave padding, so both lines
+        are rstripped.
+        
+        Returns:
+            (source_line, target_line)
+        """
+        if not pairs:
+            return "", ""
+
+        # Split off the last pair: "*interior" collects all the others
+        *interior, last = pairs
+        # Pad each word with spaces to 'width' characters, plus one separating space
+        # Example: "hi" with width 5 → "hi    "
+        source_line = "".join(
+            [pair.source_token + " " * (pair.column_width - len(pair.source_token) + 1) for pair in interior]
+        ) + last.source_token
+        target_line = "".join(
+            [pair.target_token + " " * (pair.column_width - len(pair.target_token) + 1) for pair in interior]
+        ) + last.target_token
+        # .rstrip() removes trailing spaces
+        return source_line.rstrip(), target_line.rstrip()
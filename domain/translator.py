@@ -1,11 +1,21 @@
 # Enable modern type hints (allows referencing class names before definition)
 from __future__ import annotations
 
+# re: Regular expressions (used to split lines into sentences)
+import re
+# List: Type hint for lists, e.g., List[str] means "a list of strings"
+from typing import List
+
 # Import from services → translation_service module
-# TranslationService is the interface (Protocol) for translation providers
+# TranslationService is the interface (abstract base class) for translation providers
 from services.translation_service import TranslationService
 
 
+# A sentence ends at ".", "!" or "?" followed by whitespace
+# (?<=...) looks back without consuming, so the punctuation stays with its sentence
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
 class Translator:
     """
     Standard text translator for complete sentence/paragraph translation.
@@ -51,24 +61,28 @@ class Translator:
             return ""
 
         # Process each line separately to preserve line breaks
-        lines = text.split('\n')
-        translated_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines but preserve them in output
-            if not line:
-                translated_lines.append("")
-                continue
-            
-            # Translate the entire line (not word-by-word)
-            try:
-                translated = self.translation_service.translate_text(
-                    line, source_lang=source_lang, target_lang=target_lang
-                )
-                translated_lines.append(translated)
-            except Exception as exc:
-                # If translation fails, use an error message
-                translated_lines.append(f"[Translation Error: {exc}]")
-        
-        return "\n".join(translated_lines)
+        lines = [line.strip() for line in text.split('\n')]
+
+        # Split every line into sentences (empty lines have none)
+        sentences_per_line = [_SENTENCE_SPLIT.split(line) if line else [] for line in lines]
+        sentences = [sentence for line_sentences in sentences_per_line for sentence in line_sentences]
+
+        # Translate all sentences of the text together (not word-by-word)
+        translations = iter(self._translate_sentences(sentences, source_lang, target_lang))
+
+        # Put each line back together from its translated sentences, keeping the empty lines
+        return "\n".join(
+            " ".join(next(translations) for _ in line_sentences) for line_sentences in sentences_per_line
+        )
+
+    def _translate_sentences(self, sentences: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate all sentences with one batch call, falling back to one call per sentence."""
+        try:
+            return self.translation_service.translate_texts(
+                sentences, source_lang=source_lang, target_lang=target_lang
+            )
+        except Exception:
+            # Batch failed: translate sentence by sentence so only the broken ones show an error
+            return self.translation_service.translate_texts_safely(
+                sentences, source_lang=source_lang, target_lang=target_lang
+            )
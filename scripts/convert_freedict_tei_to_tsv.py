@@ -2,6 +2,16 @@ import csv
 import re
 import sys
 import xml.etree.ElementTree as ET
+from typing import Iterator
+
+# Compiled once; these run several times for every entry of the dictionary
+_WHITESPACE = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCT = re.compile(r"\s+([,.;:!?])")
+_SPACE_AFTER_BRACKET = re.compile(r"(\()\s+")
+_REPEATED_SPACES = re.compile(r"\s{2,}")
+
+# Report progress after this many entries (large dictionaries take a while)
+PROGRESS_EVERY = 10_000
 
 
 def localname(tag: str) -> str:
@@ -13,7 +23,7 @@ def localname(tag: str) -> str:
 
 def normalize_spaces(text: str) -> str:
     """Collapse whitespace and trim."""
-    return re.sub(r"\s+", " ", (text or "").strip())
+    return _WHITESPACE.sub(" ", (text or "").strip())
 
 
 def text_with_spaces(elem: ET.Element) -> str:
@@ -27,17 +37,29 @@ def text_with_spaces(elem: ET.Element) -> str:
     text = " ".join(parts)
 
     # Remove spaces before punctuation: "word ," -> "word,"
-    text = re.sub(r"\s+([,.;:!?])", r"\1", text)
+    text = _SPACE_BEFORE_PUNCT.sub(r"\1", text)
 
     # Remove spaces after opening brackets: "( word" -> "(word"
-    text = re.sub(r"(\()\s+", r"\1", text)
+    text = _SPACE_AFTER_BRACKET.sub(r"\1", text)
 
     # Collapse repeated spaces again, just in case
-    text = re.sub(r"\s{2,}", " ", text).strip()
+    text = _REPEATED_SPACES.sub(" ", text).strip()
 
     return text
 
 
+def dedupe_casefold(items: list[str]) -> list[str]:
+    """
+    Deduplicate while preserving order (case-insensitive, first spelling wins).
+
+    casefold() is the Unicode-aware lower(): "Straße" and "STRASSE" count as equal.
+    """
+    unique: dict[str, str] = {}
+    for item in items:
+        unique.setdefault(item.casefold(), item)
+    return list(unique.values())
+
+
 def extract_headwords(entry_elem: ET.Element) -> list[str]:
     """
     Extract headwords from common FreeDict TEI structures:
@@ -49,37 +71,27 @@ def extract_headwords(entry_elem: ET.Element) -> list[str]:
     headwords: list[str] = []
 
     # Prefer lemma forms
-    for form in entry_elem.iter():
-        if localname(form.tag) != "form":
-            continue
+    # "{*}" matches the tag in any (or no) namespace, so ElementTree does the
+    # tag filtering instead of a localname() call per element
+    for form in entry_elem.iterfind(".//{*}form"):
+        # Checked here rather than with [@type='lemma']: the type is case-insensitive
         form_type = (form.attrib.get("type") or "").lower()
         if form_type != "lemma":
             continue
 
-        for orth in form.iter():
-            if localname(orth.tag) == "orth":
-                hw = normalize_spaces(text_with_spaces(orth))
-                if hw:
-                    headwords.append(hw)
+        for orth in form.iterfind(".//{*}orth"):
+            hw = normalize_spaces(text_with_spaces(orth))
+            if hw:
+                headwords.append(hw)
 
     # Fallback: any orth in entry
     if not headwords:
-        for orth in entry_elem.iter():
-            if localname(orth.tag) == "orth":
-                hw = normalize_spaces(text_with_spaces(orth))
-                if hw:
-                    headwords.append(hw)
-
-    # Deduplicate while preserving order (case-insensitive)
-    seen = set()
-    unique: list[str] = []
-    for hw in headwords:
-        key = hw.lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append(hw)
+        for orth in entry_elem.iterfind(".//{*}orth"):
+            hw = normalize_spaces(text_with_spaces(orth))
+            if hw:
+                headwords.append(hw)
 
-    return unique
+    return dedupe_casefold(headwords)
 
 
 def extract_translations(entry_elem: ET.Element) -> list[str]:
@@ -91,29 +103,57 @@ def extract_translations(entry_elem: ET.Element) -> list[str]:
     """
     translations: list[str] = []
 
-    for cit in entry_elem.iter():
-        if localname(cit.tag) != "cit":
-            continue
+    for cit in entry_elem.iterfind(".//{*}cit"):
         cit_type = (cit.attrib.get("type") or "").lower()
         if cit_type != "trans":
             continue
 
-        for quote in cit.iter():
-            if localname(quote.tag) == "quote":
-                tr = normalize_spaces(text_with_spaces(quote))
-                if tr:
-                    translations.append(tr)
+        for quote in cit.iterfind(".//{*}quote"):
+            tr = normalize_spaces(text_with_spaces(quote))
+            if tr:
+                translations.append(tr)
+
+    return dedupe_casefold(translations)
+
+
+def iter_entries(input_tei_path: str) -> Iterator[ET.Element]:
+    """
+    Yield every <entry> element of a TEI file in document order.
+
+    The file is parsed incrementally: once an outermost entry (and any entries
+    nested in it) has been handled, it is removed from the tree, so memory
+    stays bounded by the largest entry instead of the whole dictionary.
+    """
+    parents: list[ET.Element] = []  # Open elements above the current one
+    entry_depth = 0  # Number of open <entry> elements
+
+    for event, elem in ET.iterparse(input_tei_path, events=("start", "end")):
+        is_entry = localname(elem.tag) == "entry"
+
+        if event == "start":
+            parents.append(elem)
+            if is_entry:
+                entry_depth += 1
+            continue
+
+        parents.pop()
+        if not is_entry:
+            continue
+        entry_depth -= 1
+        # Nested entries are yielded together with their outermost entry,
+        # which still needs their content
+        if entry_depth:
+            continue
 
-    # Deduplicate while preserving order (case-insensitive)
-    seen = set()
-    unique: list[str] = []
-    for tr in translations:
-        key = tr.lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append(tr)
+        # The entry itself first, then nested entries (same order as root.iter())
+        for entry in list(elem.iter()):
+            if localname(entry.tag) == "entry":
+                yield entry
 
-    return unique
+        # Done with this entry: drop it from the tree to free its memory
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
 
 
 def convert_tei_to_tsv(input_tei_path: str, output_tsv_path: str) -> None:
@@ -123,18 +163,19 @@ def convert_tei_to_tsv(input_tei_path: str, output_tsv_path: str) -> None:
 
     Writes every combination of (headword, translation) for each entry.
     """
-    tree = ET.parse(input_tei_path)
-    root = tree.getroot()
-
     rows_written = 0
     entries_skipped = 0
+    entries_seen = 0
 
-    with open(output_tsv_path, "w", encoding="utf-8", newline="") as f:
+    # 1 MiB write buffer: far fewer write() calls than the default 8 KiB
+    with open(output_tsv_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f, delimiter="\t")
 
-        for elem in root.iter():
-            if localname(elem.tag) != "entry":
-                continue
+        for entries_seen, elem in enumerate(iter_entries(input_tei_path), start=1):
+            if entries_seen % PROGRESS_EVERY == 0:
+                # "\r" returns to the line start, so the counter updates in place
+                sys.stdout.write(f"\rEntries processed: {entries_seen}")
+                sys.stdout.flush()
 
             headwords = extract_headwords(elem)
             translations = extract_translations(elem)
@@ -143,11 +184,12 @@ def convert_tei_to_tsv(input_tei_path: str, output_tsv_path: str) -> None:
                 entries_skipped += 1
                 continue
 
-            for hw in headwords:
-                for tr in translations:
-                    writer.writerow([hw, tr])
-                    rows_written += 1
+            rows = [(hw, tr) for hw in headwords for tr in translations]
+            writer.writerows(rows)
+            rows_written += len(rows)
 
+    if entries_seen >= PROGRESS_EVERY:
+        sys.stdout.write("\n")
     print(f"Done. Rows written: {rows_written}, skipped entries: {entries_skipped}")
 
 
@@ -5,14 +5,45 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 # dataclass: A decorator that automatically generates __init__, __repr__ and other methods
 from dataclasses import dataclass
+# OrderedDict: a dict that remembers insertion order (used as a small LRU cache)
+from collections import OrderedDict
 # Type hints
 from typing import Optional
 # For image processing
 from PIL import Image
 import io
+import threading
 import numpy as np
 
 
+def _clean_ocr_text(text: str) -> str:
+    """Clean up extracted text by removing excessive whitespace.
+    
+    Shared by all OCR services.
+    
+    Args:
+        text: Raw OCR text
+        
+    Returns:
+        Cleaned text with:
+        - Removed leading/trailing whitespace
+        - Removed multiple consecutive spaces
+        - Preserved line breaks
+    """
+    # Split into lines to preserve line breaks
+    # .split() without arguments drops leading/trailing whitespace and
+    # splits on runs of whitespace, so joining with " " collapses them in one pass
+    return '\n'.join(' '.join(line.split()) for line in text.split('\n'))
+
+
+# EasyOCR readers shared by all EasyOCRService instances, keyed by language tuple
+# Each reader holds ~100MB of model weights, so only the most recently used few are kept
+_EASYOCR_READERS: OrderedDict = OrderedDict()
+_EASYOCR_READERS_MAX = 3
+# Two sessions asking for the same new reader should load the model only once
+_EASYOCR_READERS_LOCK = threading.Lock()
+
+
 class OCRService(ABC):
     """Abstract interface for OCR (Optical Character Recognition) providers.
     
@@ -101,7 +132,7 @@ class TesseractOCRService(OCRService):
             )
             
             # Clean up the text
-            text = self._clean_text(text)
+            text = _clean_ocr_text(text)
             
             return text
             
@@ -110,34 +141,6 @@ class TesseractOCRService(OCRService):
         except Exception as e:
             return f"[OCR Error: {str(e)}]"
     
-    def _clean_text(self, text: str) -> str:
-        """Clean up extracted text by removing excessive whitespace.
-        
-        Args:
-            text: Raw OCR text
-            
-        Returns:
-            Cleaned text with:
-            - Removed leading/trailing whitespace
-            - Removed multiple consecutive spaces
-            - Preserved line breaks
-        """
-        # Split into lines to preserve line breaks
-        lines = text.split('\n')
-        
-        # Clean each line
-        cleaned_lines = []
-        for line in lines:
-            # Remove leading/trailing whitespace
-            line = line.strip()
-            # Replace multiple spaces with single space
-            import re
-            line = re.sub(r' +', ' ', line)
-            cleaned_lines.append(line)
-        
-        # Join lines back together
-        return '\n'.join(cleaned_lines)
-    
     @staticmethod
     def get_language_code(language_label: str) -> str:
         """Convert language display name to Tesseract language code.
@@ -185,9 +188,6 @@ class EasyOCRService(OCRService):
     - Portuguese (pt)
     """
     
-    # Cache the reader instance to avoid reloading models
-    _reader = None
-    
     @property
     def name(self) -> str:
         """Return the display name of this service."""
@@ -204,19 +204,27 @@ class EasyOCRService(OCRService):
         """
         try:
             import easyocr
-            
-            # Create reader if not exists or languages changed
-            if self._reader is None:
-                self._reader = easyocr.Reader(
+        except ImportError:
+            return None
+
+        # Reuse the reader for these languages; create it only the first time
+        key = tuple(languages)
+        with _EASYOCR_READERS_LOCK:
+            reader = _EASYOCR_READERS.get(key)
+            if reader is None:
+                reader = easyocr.Reader(
                     languages,
                     gpu=False,  # Use CPU (GPU might not be available)
                     verbose=False,  # Less console output
                 )
-            
-            return self._reader
-            
-        except ImportError:
-            return None
+                _EASYOCR_READERS[key] = reader
+                # Drop the least recently used reader if we keep too many
+                if len(_EASYOCR_READERS) > _EASYOCR_READERS_MAX:
+                    _EASYOCR_READERS.popitem(last=False)
+            else:
+                # Mark as recently used
+                _EASYOCR_READERS.move_to_end(key)
+            return reader
     
     def extract_text(self, image: Image.Image, lang: str = 'eng') -> str:
         """Extract text from an image using EasyOCR.
@@ -246,8 +254,17 @@ class EasyOCRService(OCRService):
             if reader is None:
                 return "[Error: easyocr not installed. Install with: pip install easyocr]"
             
+            # EasyOCR works on RGB or grayscale pixels; convert other modes
+            # (palette, RGBA, CMYK, ...) once here instead of inside EasyOCR
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+
             # Convert PIL Image to numpy array
-            image_array = np.array(image)
+            # np.asarray avoids the extra copy that np.array always makes
+            image_array = np.asarray(image)
+            # Downstream code expects a contiguous block of memory
+            if not image_array.flags['C_CONTIGUOUS']:
+                image_array = np.ascontiguousarray(image_array)
             
             # Perform OCR
             # readtext returns list of tuples: (bbox, text, confidence)
@@ -260,7 +277,7 @@ class EasyOCRService(OCRService):
             full_text = '\n'.join(texts)
             
             # Clean up the text
-            text = self._clean_text(full_text)
+            text = _clean_ocr_text(full_text)
             
             return text
             
@@ -269,34 +286,6 @@ class EasyOCRService(OCRService):
         except Exception as e:
             return f"[OCR Error: {str(e)}]"
     
-    def _clean_text(self, text: str) -> str:
-        """Clean up extracted text by removing excessive whitespace.
-        
-        Args:
-            text: Raw OCR text
-            
-        Returns:
-            Cleaned text with:
-            - Removed leading/trailing whitespace
-            - Removed multiple consecutive spaces
-            - Preserved line breaks
-        """
-        # Split into lines to preserve line breaks
-        lines = text.split('\n')
-        
-        # Clean each line
-        cleaned_lines = []
-        for line in lines:
-            # Remove leading/trailing whitespace
-            line = line.strip()
-            # Replace multiple spaces with single space
-            import re
-            line = re.sub(r' +', ' ', line)
-            cleaned_lines.append(line)
-        
-        # Join lines back together
-        return '\n'.join(cleaned_lines)
-    
     @staticmethod
     def get_language_code(language_label: str) -> str:
         """Convert language display name to EasyOCR language code.
@@ -0,0 +1,352 @@
+# Enable modern type hints
+from __future__ import annotations
+
+# OrderedDict: Dictionary that remembers insertion order (used for the LRU cache)
+from collections import OrderedDict
+# Future: A result that other threads can wait for (used to share in-flight requests)
+from concurrent.futures import Future
+# lru_cache: Remembers a function's result (here: open the persistent cache only once)
+from functools import lru_cache
+# sqlite3: File-based SQL database that ships with Python (no server needed)
+import sqlite3
+import threading
+# time: Timestamps for the cache expiry (TTL) and of stored rows
+import time
+# Path: Object-oriented file system paths
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Where translations are stored between app restarts
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "langdec" / "translations.sqlite3"
+
+# SQLite limits the number of "?" placeholders per query, so lookups go in chunks
+_LOOKUP_CHUNK_SIZE = 500
+
+# How long Google translations stay cached, in memory and on disk (seconds)
+# Google's answers can change over time; local Argos models do not, so their caches never expire
+TRANSLATION_CACHE_TTL = 48 * 3600
+
+# Namespaces in the on-disk cache: one per service and kind of request
+GOOGLE_WORDS = "google:word"
+GOOGLE_TEXTS = "google:text"
+ARGOS_WORDS = "argos:word"
+ARGOS_TEXTS = "argos:text"
+# Maximum age of on-disk entries per namespace: Google's answers expire like
+# the in-memory ones; Argos word translations are kept (missing here = no limit),
+# pasted Argos sentences only for a while, so user texts don't pile up on disk
+_PERSISTENT_MAX_AGE = {
+    GOOGLE_WORDS: TRANSLATION_CACHE_TTL,
+    GOOGLE_TEXTS: TRANSLATION_CACHE_TTL,
+    ARGOS_TEXTS: 30 * 24 * 3600,
+}
+
+# Upper bound for the rows in the on-disk cache; the oldest rows are dropped beyond it
+MAX_PERSISTENT_ROWS = 200_000
+# Expired and surplus rows are removed when the cache is opened and after this many writes
+_PRUNE_EVERY_ROWS = 1_000
+
+
+class LRUCache:
+    """Small thread-safe LRU cache: when full, the least recently used entry is dropped.
+    
+    Unlike functools.lru_cache it can be filled from outside, e.g. with
+    the results of a batch request, and single entries can be removed.
+    
+    Args:
+        max_size: Maximum number of entries
+        ttl: Seconds after which an entry expires (None: never)
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        self._max_size = max_size
+        self._ttl = ttl
+        # Values are stored as (value, time stored)
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key) -> Optional[str]:
+        """Return the cached value, or None if the key is unknown or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if self._ttl is not None and time.monotonic() - stored_at >= self._ttl:
+                # Too old: forget it, the caller fetches a fresh translation
+                del self._data[key]
+                return None
+            # Mark as recently used
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value: Optional[str], age: float = 0.0) -> None:
+        """Store a value (None is not cached), dropping the oldest entry if full.
+
+        Args:
+            age: How many seconds ago the value was fetched (e.g. for entries
+                loaded from the on-disk cache), so it expires at the right time
+        """
+        if value is None:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() - age)
+            self._data.move_to_end(key)
+            if len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        """Remove one entry (no error if it is not cached)."""
+        with self._lock:
+            self._data.pop(key, None)
+
+
+
+
+class PersistentTranslationCache:
+    """Translations stored in a SQLite file, so they survive app restarts.
+
+    This is the second cache level: the in-memory LRU caches answer first,
+    this cache answers when the process is new, and only texts missing in
+    both are sent to the translation backend.
+
+    Every backend and kind of request has its own namespace
+    (e.g. "google:word" or "argos:text"), so their results never mix.
+    Keys are (namespace, source language, target language, text).
+    Every row remembers when it was stored (ts): rows older than their
+    namespace's maximum age are ignored and later deleted, and beyond
+    max_rows the oldest rows are deleted, so the file stays bounded.
+    One connection is shared by all threads, guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        max_ages: Optional[Dict[str, float]] = None,
+        max_rows: int = MAX_PERSISTENT_ROWS,
+    ):
+        """Open (or create) the cache file and remove expired rows.
+
+        Args:
+            path: Location of the SQLite file; parent folders are created if needed
+            max_ages: Maximum age in seconds per namespace (namespaces not listed never expire)
+            max_rows: Maximum number of rows kept in the file
+
+        Raises:
+            OSError, sqlite3.Error: If the file cannot be created or opened
+        """
+        self._max_ages = dict(max_ages or {})
+        self._max_rows = max_rows
+        # Rows written since the last prune()
+        self._rows_since_prune = 0
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # check_same_thread=False: allowed because all access goes through self._lock
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        # WAL lets readers (e.g. a second app process) work while we write
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " namespace TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " target TEXT NOT NULL,"
+            " text TEXT NOT NULL,"
+            " translation TEXT NOT NULL,"
+            " ts REAL NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (namespace, source, target, text))"
+        )
+        # Files created before the ts column existed: add it (old rows get ts 0,
+        # so they count as expired wherever a maximum age is used)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(translations)")}
+        if "ts" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE translations ADD COLUMN ts REAL NOT NULL DEFAULT 0")
+        # Pruning looks for the oldest rows
+        self._conn.execute("CREATE INDEX IF NOT EXISTS translations_ts ON translations (ts)")
+        self.prune()
+
+    def prune(self) -> None:
+        """Delete expired rows, then the oldest rows beyond max_rows."""
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                for namespace, max_age in self._max_ages.items():
+                    self._conn.execute(
+                        "DELETE FROM translations WHERE namespace = ? AND ts < ?",
+                        (namespace, now - max_age),
+                    )
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()
+                if count > self._max_rows:
+                    self._conn.execute(
+                        "DELETE FROM translations WHERE rowid IN"
+                        " (SELECT rowid FROM translations ORDER BY ts LIMIT ?)",
+                        (count - self._max_rows,),
+                    )
+            self._rows_since_prune = 0
+
+    def get_many(
+        self,
+        namespace: str,
+        texts: List[str],
+        source: str,
+        target: str,
+    ) -> Dict[str, Tuple[str, float]]:
+        """Look up several texts at once (rows older than the namespace's maximum age are ignored).
+
+        Returns:
+            Mapping text → (translation, time stored) for the texts that are stored
+            (unknown texts are left out)
+        """
+        # Rows older than this timestamp are left out (0: every row is recent enough)
+        max_age = self._max_ages.get(namespace)
+        oldest = time.time() - max_age if max_age is not None else 0
+        found: Dict[str, Tuple[str, float]] = {}
+        for start in range(0, len(texts), _LOOKUP_CHUNK_SIZE):
+            chunk = texts[start:start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT text, translation, ts FROM translations"
+                    " WHERE namespace = ? AND source = ? AND target = ? AND ts >= ?"
+                    f" AND text IN ({placeholders})",
+                    (namespace, source, target, oldest, *chunk),
+                ).fetchall()
+            found.update((text, (translation, ts)) for text, translation, ts in rows)
+        return found
+
+    def delete(self, namespace: str, text: str, source: str, target: str) -> None:
+        """Remove one stored translation (no error if it is not stored)."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM translations"
+                    " WHERE namespace = ? AND source = ? AND target = ? AND text = ?",
+                    (namespace, source, target, text),
+                )
+
+    def put_many(
+        self,
+        namespace: str,
+        items: Iterable[Tuple[str, Optional[str]]],
+        source: str,
+        target: str,
+    ) -> None:
+        """Store several (text, translation) pairs in one transaction (None values are skipped)."""
+        now = time.time()
+        rows = [
+            (namespace, source, target, text, translation, now)
+            for text, translation in items
+            if translation is not None
+        ]
+        if not rows:
+            return
+        with self._lock:
+            # One transaction for all rows (committed when the block ends):
+            # much faster than committing each insert
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO translations (namespace, source, target, text, translation, ts)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            self._rows_since_prune += len(rows)
+            needs_prune = self._rows_since_prune >= _PRUNE_EVERY_ROWS
+        if needs_prune:
+            self.prune()
+
+
+@lru_cache(maxsize=None)
+def get_persistent_cache() -> Optional[PersistentTranslationCache]:
+    """Open the on-disk translation cache once per process.
+    
+    Returns None if it cannot be used (e.g. read-only file system);
+    translation then simply works without it.
+    """
+    try:
+        return PersistentTranslationCache(max_ages=_PERSISTENT_MAX_AGE)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def load_persistent(
+    namespace: str, texts: List[str], source: str, target: str, memory_cache: LRUCache
+) -> Dict[str, str]:
+    """Look up words or texts in the on-disk cache (empty result if it is unavailable).
+    
+    Entries older than the namespace's maximum age are left out, so they
+    are translated again. Found entries are also put into memory_cache
+    (keyed like the services: (text, source, target)) with their real age,
+    so they expire there when they would have expired on disk.
+    """
+    cache = get_persistent_cache()
+    if cache is None or not texts:
+        return {}
+    try:
+        rows = cache.get_many(namespace, texts, source, target)
+    except sqlite3.Error:
+        return {}
+    now = time.time()
+    found: Dict[str, str] = {}
+    for text, (translation, stored_at) in rows.items():
+        found[text] = translation
+        # max(): a clock that went backwards must not make the entry younger than new
+        memory_cache.put((text, source, target), translation, age=max(0.0, now - stored_at))
+    return found
+
+
+def store_persistent(
+    namespace: str, translations: Dict[str, Optional[str]], source: str, target: str
+) -> None:
+    """Save new translations to the on-disk cache (None values and failures are ignored)."""
+    cache = get_persistent_cache()
+    if cache is None or not translations:
+        return
+    try:
+        cache.put_many(namespace, translations.items(), source, target)
+    except sqlite3.Error:
+        pass
+
+
+def delete_persistent(namespace: str, text: str, source: str, target: str) -> None:
+    """Remove one translation from the on-disk cache (failures are ignored)."""
+    cache = get_persistent_cache()
+    if cache is None:
+        return
+    try:
+        cache.delete(namespace, text, source, target)
+    except sqlite3.Error:
+        pass
+
+
+# Translations currently being computed, keyed by (service, text, source, target)
+_IN_FLIGHT: Dict[tuple, Future] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def coalesced(key: tuple, compute: Callable[[], Optional[str]]) -> Optional[str]:
+    """Run compute() once for all threads that ask for the same key at the same time.
+    
+    The first caller does the work; callers arriving while it runs wait for
+    its result (or its exception) instead of sending a duplicate request.
+    """
+    with _IN_FLIGHT_LOCK:
+        future = _IN_FLIGHT.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _IN_FLIGHT[key] = Future()
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = compute()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        # Later callers read the cache (or start a new request)
+        with _IN_FLIGHT_LOCK:
+            del _IN_FLIGHT[key]
@@ -3,13 +3,260 @@ from __future__ import annotations
 
 # ABC: Abstract Base Class for defining interfaces
 from abc import ABC, abstractmethod
+# ThreadPoolExecutor: Runs several (network-bound) calls at the same time
+from concurrent.futures import ThreadPoolExecutor
 # dataclass: A decorator that automatically generates __init__, __repr__ and other methods
 from dataclasses import dataclass
+# lru_cache: Remembers a function's result (e.g. the Argos model per language pair)
+from functools import lru_cache
 # Optional: Type hint that means "this can be the specified type OR None"
-from typing import Optional
+# List: Type hint for lists, e.g., List[str] means "a list of strings"
+# ClassVar: Marks a dataclass attribute as shared by the class (not an __init__ argument)
+# Callable: Type hint for functions, e.g., Callable[..., str] returns a string
+# TYPE_CHECKING: True only for type checkers, so the imports below cost nothing at runtime
+from typing import TYPE_CHECKING, Callable, ClassVar, Dict, List, Optional, Tuple
+# sys.intern: Keeps one shared copy of a string (used for language codes in cache keys)
+import sys
+# re: Regular expressions (splitting long texts at sentence ends)
+import re
+# threading: Semaphore that limits the Google requests in flight
+import threading
+# unicodedata: Unicode normalization (same letter, different byte sequences)
+import unicodedata
 
-# Import the external translation libraries (need to be installed via pip)
-from deep_translator import GoogleTranslator
+# Caching helpers: in-memory LRU caches, the on-disk cache (so translations
+# survive app restarts) and sharing of identical requests that are in flight
+from services.translation_cache import (
+    ARGOS_TEXTS,
+    ARGOS_WORDS,
+    GOOGLE_TEXTS,
+    GOOGLE_WORDS,
+    TRANSLATION_CACHE_TTL,
+    LRUCache,
+    coalesced,
+    delete_persistent,
+    load_persistent,
+    store_persistent,
+)
+
+# The external translation libraries (need to be installed via pip) are
+# imported on first use instead of here, see _google_translator_class():
+# someone who only uses Argos never loads deep_translator and its dependencies
+if TYPE_CHECKING:
+    import requests
+    from deep_translator import GoogleTranslator
+
+
+# Upper bound for parallel requests per batch (keeps us below provider rate limits)
+MAX_TRANSLATION_WORKERS = 16
+
+# Characters per batched Google request (deep_translator rejects more than 5000)
+MAX_REQUEST_CHARS = 4000
+
+# Split points for texts that are too long for one request: the whitespace after
+# a sentence end, or (for overlong sentences) any whitespace
+# The capturing group keeps the whitespace, so line breaks survive the split
+_SENTENCE_GAP = re.compile(r"(?<=[.!?])(\s+)")
+_WORD_GAP = re.compile(r"(\s+)")
+
+
+class _PooledRequests:
+    """Stand-in for the ``requests`` module inside deep_translator.
+    
+    Sends ``requests.get`` through one shared Session, so TCP/TLS connections
+    are kept alive and reused instead of being opened for every single word.
+    Everything else is looked up on the real ``requests`` module.
+    """
+
+    def __init__(self, requests_module, session: requests.Session):
+        self._requests = requests_module
+        self._session = session
+
+    def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._requests, name)
+
+
+def _create_http_session() -> requests.Session:
+    """Create a Session with a connection pool big enough for the parallel word requests."""
+    # requests: HTTP library used by deep_translator (installed together with it)
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=2 * MAX_TRANSLATION_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _google_translator_class() -> type:
+    """Import deep_translator's GoogleTranslator on first use (once per process).
+    
+    Also routes its HTTP calls through one pooled session.
+    
+    Raises:
+        ImportError: If deep_translator is not installed
+    """
+    import requests
+    from deep_translator import GoogleTranslator
+
+    try:
+        # The module whose requests.get() call GoogleTranslator uses
+        from deep_translator import google as deep_translator_google
+    except ImportError:  # Older deep_translator versions use a different layout
+        deep_translator_google = None
+
+    # deep_translator has no option to pass in a session, so we swap the module
+    # reference it calls. Side effect: every GoogleTranslator in this process
+    # uses the shared pooled session.
+    if deep_translator_google is not None and hasattr(deep_translator_google, "requests"):
+        deep_translator_google.requests = _PooledRequests(requests, _create_http_session())
+    return GoogleTranslator
+
+
+# Shared by all instances, so words stay cached across decodes and users of this process
+# Keys: (normalized word, source language, target language)
+_GOOGLE_WORD_CACHE = LRUCache(max_size=100_000, ttl=TRANSLATION_CACHE_TTL)
+# Same for Argos (separate, because the two services translate differently)
+_ARGOS_WORD_CACHE = LRUCache(max_size=100_000)
+# Whole texts/sentences from translate_text
+# Keys: (text, source language, target language)
+_GOOGLE_TEXT_CACHE = LRUCache(max_size=10_000, ttl=TRANSLATION_CACHE_TTL)
+_ARGOS_TEXT_CACHE = LRUCache(max_size=10_000)
+
+def invalidate_cached_translation(text: str, source_lang: str, target_lang: str) -> None:
+    """Forget every cached translation of a word or text, e.g. after a user corrected it.
+    
+    Clears the in-memory and on-disk caches of all services;
+    the next request translates it again. These are the only translation
+    caches: the decoder, the translator and the app ask the services
+    directly, so a correction shows up in the next decode/translate.
+    """
+    source_lang, target_lang = _resolve_languages(source_lang, target_lang)
+    # Words and texts use the same key normalization
+    key = (_cache_key(text), source_lang, target_lang)
+    for cache in (_GOOGLE_WORD_CACHE, _ARGOS_WORD_CACHE, _GOOGLE_TEXT_CACHE, _ARGOS_TEXT_CACHE):
+        cache.invalidate(key)
+    for namespace in (GOOGLE_WORDS, ARGOS_WORDS, GOOGLE_TEXTS, ARGOS_TEXTS):
+        delete_persistent(namespace, *key)
+
+
+@lru_cache(maxsize=32)
+def _resolve_languages(source: str, target: str) -> Tuple[str, str]:
+    """Return the language pair used for cache keys and requests.
+    
+    The codes are interned, so equal codes are the same object and cache
+    key comparisons are cheap. The pair changes rarely, so it is computed
+    once and then answered from the lru_cache.
+    """
+    return sys.intern(source), sys.intern(target)
+
+
+def _new_google_translator(source: str, target: str) -> GoogleTranslator:
+    """Create a GoogleTranslator for one request.
+    
+    Not reused: translate() stores the request parameters on the object, so
+    parallel requests must not share one. Creating it is cheap (it only
+    checks the language codes against a dict), the network call dominates.
+    """
+    return _google_translator_class()(source=source, target=target)
+
+
+@lru_cache(maxsize=64)
+def _get_argos_translation(source: str, target: str):
+    """Return the Argos translation object for a language pair, looked up once.
+    
+    argostranslate.translate.translate() searches the installed language
+    packages on every call; the object it finds can be reused instead.
+    
+    Raises:
+        ImportError: If argostranslate is not installed
+        ValueError: If no model for this language pair is installed (not cached,
+            so a model installed later is picked up)
+    """
+    import argostranslate.translate
+
+    translation = argostranslate.translate.get_translation_from_codes(source, target)
+    if translation is None:
+        raise ValueError(f"No Argos model installed for {source} → {target}")
+    return translation
+
+
+def _chunk_by_length(items: List[str], max_chars: int) -> List[List[str]]:
+    """Group strings so that each group, joined with newlines, stays within max_chars."""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_length = 0
+    for item in items:
+        # +1 for the newline that joins the items
+        if current and current_length + len(item) + 1 > max_chars:
+            chunks.append(current)
+            current = []
+            current_length = 0
+        current.append(item)
+        current_length += len(item) + 1
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _cache_key(text: str) -> str:
+    """Normalize a word or text for cache keys and requests.
+    
+    Surrounding whitespace is removed, and the composed and decomposed
+    Unicode forms of accented letters (NFC, e.g. from OCR) share one entry.
+    Casing is kept: it carries meaning (German "Sie"/"sie", "Essen"/"essen",
+    proper nouns), so the translator sees the word as it was written.
+    """
+    return unicodedata.normalize("NFC", text.strip())
+
+
+def _split_long_text(text: str, max_chars: int) -> Tuple[List[str], List[str]]:
+    """Split a text into pieces of at most max_chars, preferably at sentence ends.
+    
+    Every piece is guaranteed to fit, so translating the pieces never needs
+    another split.
+    
+    Returns:
+        (pieces, gaps): gaps[i] is the original whitespace between pieces[i]
+        and pieces[i + 1], so the translated pieces can be joined the same way
+    """
+    # Units that must not be split further, and the whitespace before each one
+    units: List[str] = []
+    gaps_before: List[str] = []
+    parts = _SENTENCE_GAP.split(text)  # [sentence, gap, sentence, gap, ...]
+    for i in range(0, len(parts), 2):
+        gap = parts[i - 1] if i else ""
+        sentence = parts[i]
+        if len(sentence) <= max_chars:
+            units.append(sentence)
+            gaps_before.append(gap)
+            continue
+        # A single sentence longer than a request: fall back to word boundaries
+        words = _WORD_GAP.split(sentence)
+        for j in range(0, len(words), 2):
+            word = words[j]
+            word_gap = words[j - 1] if j else gap
+            # Still too long without any whitespace (URL, base64, CJK text):
+            # cut it into max_chars slices, so every piece fits into one request
+            for start in range(0, len(word), max_chars):
+                units.append(word[start:start + max_chars])
+                gaps_before.append(word_gap if start == 0 else "")
+
+    # Greedily pack as many units as fit into each piece
+    pieces = [units[0]]
+    gaps: List[str] = []
+    for unit, gap in zip(units[1:], gaps_before[1:]):
+        if len(pieces[-1]) + len(gap) + len(unit) > max_chars:
+            pieces.append(unit)
+            gaps.append(gap)
+        else:
+            pieces[-1] += gap + unit
+    return pieces, gaps
 
 
 # ABC = Abstract Base Class: Defines an interface that subclasses must implement
@@ -20,6 +267,9 @@ class TranslationService(ABC):
     Think of it as a contract: any translation service must have these methods.
     """
 
+    # No per-instance __dict__ here either, so subclasses using slots stay dict-free
+    __slots__ = ()
+
     @abstractmethod
     def translate_word(self, word: str, source_lang: str, target_lang: str) -> str:
         """Translate a single word."""
@@ -29,6 +279,83 @@ class TranslationService(ABC):
     def translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translate complete text (sentences/paragraphs)."""
         pass
+
+    def translate_words(self, words: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate several words in one go.
+
+        Returns the translations in the same order as ``words``. The default
+        implementation calls ``translate_word`` for each entry, running up to
+        MAX_TRANSLATION_WORKERS requests in parallel; providers with a real
+        batch endpoint should override this.
+        """
+        return self._translate_each(self.translate_word, words, source_lang, target_lang)
+
+    def translate_texts(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate several texts (e.g. sentences) in one go.
+
+        Returns the translations in the same order as ``texts``. The default
+        implementation calls ``translate_text`` for each entry, running up to
+        MAX_TRANSLATION_WORKERS requests in parallel.
+        """
+        return self._translate_each(self.translate_text, texts, source_lang, target_lang)
+
+    def translate_words_safely(self, words: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate each word on its own, putting an error marker in place of failed words.
+
+        Useful as a fallback after ``translate_words`` failed, so only the
+        broken words show an error.
+        """
+        return self._translate_each(
+            self.translate_word, words, source_lang, target_lang, error_format="[ERR:{}]"
+        )
+
+    def translate_texts_safely(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate each text on its own, putting an error message in place of failed texts.
+
+        Useful as a fallback after ``translate_texts`` failed, so only the
+        broken texts show an error.
+        """
+        return self._translate_each(
+            self.translate_text, texts, source_lang, target_lang, error_format="[Translation Error: {}]"
+        )
+
+    def _translate_each(
+        self,
+        translate_one: Callable[..., str],
+        items: List[str],
+        source_lang: str,
+        target_lang: str,
+        error_format: Optional[str] = None,
+    ) -> List[str]:
+        """Call ``translate_one`` for every item, up to MAX_TRANSLATION_WORKERS at a time.
+        
+        Args:
+            translate_one: translate_word or translate_text of this service
+            items: The words/texts to translate
+            source_lang: Source language code (e.g., "en")
+            target_lang: Target language code (e.g., "de")
+            error_format: If given, a failed item becomes this text (with the error
+                filled in) instead of raising
+            
+        Returns:
+            The translations in the same order as ``items``
+        """
+        def translate(item: str) -> str:
+            try:
+                return translate_one(item, source_lang=source_lang, target_lang=target_lang)
+            except Exception as exc:
+                if error_format is None:
+                    raise
+                return error_format.format(exc)
+
+        # Nothing to overlap for zero or one item (a pool also needs at least one worker)
+        if len(items) <= 1:
+            return [translate(item) for item in items]
+
+        # Requests are I/O-bound, so threads overlap the waiting time
+        # executor.map keeps the results in input order
+        with ThreadPoolExecutor(max_workers=min(MAX_TRANSLATION_WORKERS, len(items))) as executor:
+            return list(executor.map(translate, items))
     
     @property
     @abstractmethod
@@ -38,7 +365,8 @@ class TranslationService(ABC):
 
 
 # @dataclass automatically creates __init__ and other methods based on the attributes below
-@dataclass
+# slots=True: attributes live in fixed slots instead of a per-instance __dict__ (less memory, faster access)
+@dataclass(slots=True)
 class GoogleDeepTranslatorService(TranslationService):
     """
     Translation service using deep_translator's GoogleTranslator.
@@ -51,12 +379,30 @@ class GoogleDeepTranslatorService(TranslationService):
     # Optional[str] means: can be a string OR None
     source_default: Optional[str] = None  # Default source language, e.g. "pt" or None
     target_default: Optional[str] = None  # Default target language, e.g. "de" or None
+
+    # Limits the requests in flight across all instances, threads and sessions,
+    # so several users decoding at once share one rate budget
+    _request_slots: ClassVar[threading.BoundedSemaphore] = threading.BoundedSemaphore(
+        MAX_TRANSLATION_WORKERS
+    )
     
     @property
     def name(self) -> str:
         """Return the display name of this service."""
         return "Google Translate"
 
+    def _request(self, payload: str, source: str, target: str) -> Optional[str]:
+        """Send one translate request to Google, waiting for a free request slot.
+        
+        An identical request already in flight (e.g. from another session)
+        is joined instead of being sent twice.
+        """
+        def send() -> Optional[str]:
+            with self._request_slots:
+                return _new_google_translator(source, target).translate(payload)
+
+        return coalesced(("google", payload, source, target), send)
+
     def translate_word(self, word: str, source_lang: str, target_lang: str) -> str:
         """Translates a single word from source language to target language.
         
@@ -70,18 +416,167 @@ class GoogleDeepTranslatorService(TranslationService):
         """
         # Use default language if set, otherwise use the provided parameter
         # "x or y" means: if x is truthy (not None, not empty), use x, else use y
-        source = self.source_default or source_lang
-        target = self.target_default or target_lang
+        source, target = _resolve_languages(
+            self.source_default or source_lang, self.target_default or target_lang
+        )
+
+        # Normalize so "Hello", "Hello " and its other Unicode forms share one cache entry
+        key = _cache_key(word)
+        if not key:
+            return word
 
-        # Create a translator object from the deep_translator library
-        translator = GoogleTranslator(source=source, target=target)
+        # Cached lookup: only the first occurrence of a word goes over the network
+        # (memory first, then the on-disk cache from earlier runs)
+        translated = _GOOGLE_WORD_CACHE.get((key, source, target))
+        if translated is None:
+            translated = load_persistent(GOOGLE_WORDS, [key], source, target, _GOOGLE_WORD_CACHE).get(key)
+            if translated is None:
+                translated = self._request(key, source, target)
+                store_persistent(GOOGLE_WORDS, {key: translated}, source, target)
+                _GOOGLE_WORD_CACHE.put((key, source, target), translated)
+        return translated
+
+    def translate_words(self, words: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translates several words with as few requests as possible.
         
-        # Call the translate method and return the result
-        return translator.translate(word)
-    
+        Words that are not cached yet are joined with newlines and sent as
+        one text request (split into chunks of MAX_REQUEST_CHARS). Google
+        translates each line on its own, so the answer can be split again.
+        
+        Args:
+            words: The words to translate
+            source_lang: Source language code (e.g., "pt" for Portuguese)
+            target_lang: Target language code (e.g., "de" for German)
+            
+        Returns:
+            The translated words, in the same order as the input
+        """
+        source, target = _resolve_languages(
+            self.source_default or source_lang, self.target_default or target_lang
+        )
+
+        # Same normalization as translate_word, so both share the cache
+        keys = [_cache_key(word) for word in words]
+
+        # Look up every distinct word once; collect the ones we still need
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            if not key:
+                continue
+            cached = _GOOGLE_WORD_CACHE.get((key, source, target))
+            if cached is None:
+                missing.append(key)
+            else:
+                found[key] = cached
+
+        # Words from earlier runs come from the on-disk cache
+        stored = load_persistent(GOOGLE_WORDS, missing, source, target, _GOOGLE_WORD_CACHE)
+        found.update(stored)
+        missing = [key for key in missing if key not in stored]
+
+        for chunk in _chunk_by_length(missing, MAX_REQUEST_CHARS):
+            translated = self._translate_lines(chunk, source, target)
+            if translated is None:
+                # Pooled per-word requests
+                # (called on the base class directly: slots=True classes do not support bare super())
+                translated = TranslationService.translate_words(
+                    self, chunk, source_lang=source, target_lang=target
+                )
+            new_translations = dict(zip(chunk, translated))
+            for key, translated in new_translations.items():
+                found[key] = translated
+                _GOOGLE_WORD_CACHE.put((key, source, target), translated)
+            # One write per request instead of one per word
+            store_persistent(GOOGLE_WORDS, new_translations, source, target)
+
+        return [found[key] if key else word for word, key in zip(words, keys)]
+
+    def _translate_lines(self, lines: List[str], source: str, target: str) -> Optional[List[str]]:
+        """Translate several single-line strings with one request.
+        
+        Returns None if Google does not return exactly one line per input
+        line; the caller then falls back to one request per line.
+        """
+        joined = self._request("\n".join(lines), source, target)
+        translated = [line.strip() for line in (joined or "").split("\n")]
+        if len(translated) == len(lines):
+            return translated
+        return None
+
+    def translate_texts(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translates several texts (e.g. sentences) with as few requests as possible.
+        
+        Works like translate_words: single-line texts that are not cached are
+        joined with newlines and sent as one request per MAX_REQUEST_CHARS.
+        Texts containing line breaks cannot be split apart again, and texts
+        longer than one request are split by translate_text, so both are
+        translated on their own (in parallel).
+        
+        Args:
+            texts: The texts to translate
+            source_lang: Source language code (e.g., "pt" for Portuguese)
+            target_lang: Target language code (e.g., "de" for German)
+            
+        Returns:
+            The translated texts, in the same order as the input
+        """
+        source, target = _resolve_languages(
+            self.source_default or source_lang, self.target_default or target_lang
+        )
+
+        # Same normalization as translate_text, so both share the cache
+        keys = [_cache_key(text) for text in texts]
+
+        # Look up every distinct text once; collect the ones we still need
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            # Blank texts are returned unchanged
+            if not key:
+                continue
+            cached = _GOOGLE_TEXT_CACHE.get((key, source, target))
+            if cached is None:
+                missing.append(key)
+            else:
+                found[key] = cached
+
+        # Texts from earlier runs come from the on-disk cache
+        stored = load_persistent(GOOGLE_TEXTS, missing, source, target, _GOOGLE_TEXT_CACHE)
+        found.update(stored)
+        missing = [key for key in missing if key not in stored]
+
+        batchable = [key for key in missing if "\n" not in key and len(key) <= MAX_REQUEST_CHARS]
+        separate = [key for key in missing if "\n" in key or len(key) > MAX_REQUEST_CHARS]
+
+        for chunk in _chunk_by_length(batchable, MAX_REQUEST_CHARS):
+            translated = self._translate_lines(chunk, source, target)
+            if translated is None:
+                # Pooled per-text requests (base class, see translate_words)
+                translated = TranslationService.translate_texts(
+                    self, chunk, source_lang=source, target_lang=target
+                )
+            new_translations = dict(zip(chunk, translated))
+            for key, translation in new_translations.items():
+                found[key] = translation
+                _GOOGLE_TEXT_CACHE.put((key, source, target), translation)
+            store_persistent(GOOGLE_TEXTS, new_translations, source, target)
+
+        if separate:
+            # translate_text caches these itself
+            found.update(zip(
+                separate,
+                TranslationService.translate_texts(self, separate, source_lang=source, target_lang=target),
+            ))
+
+        return [found.get(key, text) for text, key in zip(texts, keys)]
+
     def translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translates complete text (sentences/paragraphs) naturally.
         
+        Texts longer than MAX_REQUEST_CHARS are split at sentence ends and
+        sent as several requests (Google rejects overlong requests).
+        
         Args:
             text: The text to translate (can be multiple sentences)
             source_lang: Source language code (e.g., "pt" for Portuguese)
@@ -91,17 +586,38 @@ class GoogleDeepTranslatorService(TranslationService):
             The translated text as a string
         """
         # Use default language if set, otherwise use the provided parameter
-        source = self.source_default or source_lang
-        target = self.target_default or target_lang
+        source, target = _resolve_languages(
+            self.source_default or source_lang, self.target_default or target_lang
+        )
 
-        # Create a translator object from the deep_translator library
-        translator = GoogleTranslator(source=source, target=target)
-        
-        # Call the translate method for complete text
-        return translator.translate(text)
+        # Normalize so the same sentence with extra spaces shares one cache entry
+        key = _cache_key(text)
+        if not key:
+            return text
+
+        if len(key) > MAX_REQUEST_CHARS:
+            # The pieces are translated (and cached) on their own, then put
+            # back together with the original whitespace between them
+            pieces, gaps = _split_long_text(key, MAX_REQUEST_CHARS)
+            translated_pieces = self.translate_texts(pieces, source_lang=source, target_lang=target)
+            return translated_pieces[0] + "".join(
+                gap + piece for gap, piece in zip(gaps, translated_pieces[1:])
+            )
 
+        # Repeated sentences are answered from the cache
+        # (memory first, then the on-disk cache from earlier runs)
+        translated = _GOOGLE_TEXT_CACHE.get((key, source, target))
+        if translated is None:
+            translated = load_persistent(GOOGLE_TEXTS, [key], source, target, _GOOGLE_TEXT_CACHE).get(key)
+            if translated is None:
+                # Call the translate method for complete text
+                translated = self._request(key, source, target)
+                store_persistent(GOOGLE_TEXTS, {key: translated}, source, target)
+                _GOOGLE_TEXT_CACHE.put((key, source, target), translated)
+        return translated
 
-@dataclass
+
+@dataclass(slots=True)
 class ArgosTranslateService(TranslationService):
     """Translation service using ArgosTranslate (offline translation).
     
@@ -133,22 +649,59 @@ class ArgosTranslateService(TranslationService):
         Returns:
             The translated word as a string
         """
+        source, target = _resolve_languages(
+            self.source_default or source_lang, self.target_default or target_lang
+        )
+
+        # Normalize so "Hello", "Hello " and its other Unicode forms share one cache entry
+        key = _cache_key(word)
+        if not key:
+            return word
+
+        # Cached lookup: running the model again for a known word is wasted CPU time
+        # (memory first, then the on-disk cache from earlier runs)
+        cached = _ARGOS_WORD_CACHE.get((key, source, target))
+        if cached is None:
+            cached = load_persistent(ARGOS_WORDS, [key], source, target, _ARGOS_WORD_CACHE).get(key)
+        if cached is not None:
+            return cached
+
         try:
-            import argostranslate.package
-            import argostranslate.translate
-            
-            source = self.source_default or source_lang
-            target = self.target_default or target_lang
-            
-            # Translate using Argos
-            translated = argostranslate.translate.translate(word, source, target)
-            return translated
+            # Translate using Argos (the translation object is reused per language pair)
+            # A word and a text with the same content are the same model call, so they share the key
+            translated = coalesced(
+                ("argos", key, source, target),
+                lambda: _get_argos_translation(source, target).translate(key),
+            )
         except ImportError:
             # Fallback if argostranslate is not installed
             return f"[ArgosTranslate not installed: {word}]"
         except Exception as e:
             # Handle any translation errors
             return f"[Error: {word}]"
+
+        # Only real translations are cached, error messages are not
+        _ARGOS_WORD_CACHE.put((key, source, target), translated)
+        store_persistent(ARGOS_WORDS, {key: translated}, source, target)
+        return translated
+
+    def translate_words(self, words: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translates several words one after another.
+        
+        Argos runs locally and is CPU-bound, so parallel threads would only
+        compete for the same model.
+        """
+        return [
+            self.translate_word(word, source_lang=source_lang, target_lang=target_lang)
+            for word in words
+        ]
+
+    def translate_texts(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translates several texts one after another (CPU-bound, see translate_words)."""
+        return [
+            self.translate_text(text, source_lang=source_lang, target_lang=target_lang)
+            for text in texts
+        ]
     
     def translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translates complete text using Argos Translate.
@@ -161,15 +714,32 @@ class ArgosTranslateService(TranslationService):
         Returns:
             The translated text as a string
         """
+        source, target = _resolve_languages(
+            self.source_default or source_lang, self.target_default or target_lang
+        )
+
+        # Normalize so the same sentence with extra spaces shares one cache entry
+        key = _cache_key(text)
+        if not key:
+            return text
+
+        # Repeated sentences are answered from the cache
+        # (memory first, then the on-disk cache from earlier runs)
+        cached = _ARGOS_TEXT_CACHE.get((key, source, target))
+        if cached is None:
+            cached = load_persistent(ARGOS_TEXTS, [key], source, target, _ARGOS_TEXT_CACHE).get(key)
+        if cached is not None:
+            return cached
+
         try:
-            import argostranslate.package
-            import argostranslate.translate
-            
-            source = self.source_default or source_lang
-            target = self.target_default or target_lang
-            
-            # Translate using Argos
-            translated = argostranslate.translate.translate(text, source, target)
+            # Translate using Argos (the translation object is reused per language pair)
+            translated = coalesced(
+                ("argos", key, source, target),
+                lambda: _get_argos_translation(source, target).translate(key),
+            )
+            # Only real translations are cached, error messages are not
+            _ARGOS_TEXT_CACHE.put((key, source, target), translated)
+            store_persistent(ARGOS_TEXTS, {key: translated}, source, target)
             return translated
         except ImportError:
             # Fallback if argostranslate is not installed